@@ -1,15 +1,62 @@
+import orjson
 import requests
 import json
 from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import Config
 
 
 class APIClient:
-    def __init__(self):
+    def __init__(self, cache: bool = False):
         self.base_url = Config.BASE_URL
-        self.headers = Config.get_headers()
+        self._default_headers = Config.get_headers()
+        # The session merges its default headers into every request, a None value drops them
+        self._without_default_headers = dict.fromkeys(self._default_headers)
         self.timeout = Config.TIMEOUT
 
+        # Keep-alive session so every call reuses the pooled connection to the API.
+        # With cache=True repeated GETs are answered from memory until the next write
+        self._cache = cache
+        if cache:
+            import requests_cache
+            # Admin and session GETs share URLs, so the credential headers have to be part of the key.
+            # ignored_parameters is emptied as its default drops Authorization before matching
+            self._session = requests_cache.CachedSession(
+                backend="memory",
+                expire_after=60,
+                allowable_methods=["GET"],
+                match_headers=["X-LLMur-Key", "X-LLMur-Session", "Authorization"],
+                ignored_parameters=[],
+            )
+        else:
+            self._session = requests.Session()
+        self._session.headers.update(self._default_headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 504], raise_on_status=False),
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def warm_up(self):
+        """Open a pooled connection up front so the first test doesn't pay for the handshake"""
+        try:
+            self._session.get(f"{self.base_url}/admin/user/0", timeout=5)
+        except requests.RequestException:
+            pass
+
+    def clear_cache(self):
+        """Drop every cached GET response, a no-op when caching is off"""
+        if self._cache:
+            self._session.cache.clear()
+
+    def close(self):
+        """Release the pooled connections"""
+        self._session.close()
+
     def _make_request(
         self,
         method: str,
@@ -18,27 +65,47 @@ class APIClient:
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
         use_default_headers: bool = True,
+        stream: bool = False,
     ) -> requests.Response:
         """Make HTTP request to the API"""
         url = f"{self.base_url}{endpoint}"
 
+        if use_default_headers:
+            request_headers = headers
+        else:
+            request_headers = {**self._without_default_headers, **(headers or {})}
+            if data is not None:
+                request_headers['Content-Type'] = 'application/json'
+
         kwargs = {
-            'headers': self.headers.copy() if use_default_headers else {},
+            'headers': request_headers,
             'timeout': self.timeout
         }
 
-        if headers:
-            kwargs['headers'].update(headers)
-
         if params:
             kwargs['params'] = params
 
+        if stream:
+            kwargs['stream'] = True
+
         if data is not None:
-            kwargs['json'] = data
+            # Encoded up front with orjson instead of letting requests run json.dumps,
+            # default=dict covers the read-only MappingProxyType sample payloads
+            kwargs['data'] = orjson.dumps(data, default=dict)
+
+        response = self._session.request(method, url, **kwargs)
+
+        # Any write may change what a cached GET would return
+        if method != "GET":
+            self.clear_cache()
 
-        response = requests.request(method, url, **kwargs)
         return response
 
+    @staticmethod
+    def json_body(response: requests.Response) -> Any:
+        """Decode a response body with orjson, skipping the charset sniffing of response.json()"""
+        return orjson.loads(response.content)
+
     # User endpoints
     def get_user(self, user_id: int) -> requests.Response:
         return self._make_request('GET', f'/admin/user/{user_id}')
@@ -185,10 +252,21 @@ class APIClient:
         return self._make_request('GET', f'/admin/graph/{key}/{deployment}')
 
     # OpenAI-compatible endpoints
-    def create_chat_completion(self, payload: Dict[str, Any], bearer_token: str) -> requests.Response:
+    def create_chat_completion(self, payload: Dict[str, Any], bearer_token: Optional[str] = None) -> requests.Response:
+        if bearer_token is None:
+            # Unauthenticated, send neither a virtual key nor the default admin key
+            return self._make_request('POST', '/v1/chat/completions', payload, use_default_headers=False)
         headers = {"Authorization": f"Bearer {bearer_token}"}
         return self._make_request('POST', '/v1/chat/completions', payload, headers=headers)
 
-    def create_embeddings(self, payload: Dict[str, Any], bearer_token: str) -> requests.Response:
+    def stream_chat_completion(self, payload: Dict[str, Any], bearer_token: str) -> requests.Response:
+        """Open a streamed chat completion, the caller reads the body and closes the response"""
+        headers = {"Authorization": f"Bearer {bearer_token}"}
+        return self._make_request('POST', '/v1/chat/completions', payload, headers=headers, stream=True)
+
+    def create_embeddings(self, payload: Dict[str, Any], bearer_token: Optional[str] = None) -> requests.Response:
+        if bearer_token is None:
+            # Unauthenticated, send neither a virtual key nor the default admin key
+            return self._make_request('POST', '/v1/embeddings', payload, use_default_headers=False)
         headers = {"Authorization": f"Bearer {bearer_token}"}
         return self._make_request('POST', '/v1/embeddings', payload, headers=headers)
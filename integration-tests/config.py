@@ -1,4 +1,5 @@
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -30,7 +31,11 @@ class Config:
 
     @classmethod
     def get_headers(cls):
-        return {
-            'X-LLMur-Key': cls.API_KEY,
-            'Content-Type': 'application/json'
-        }
+        return _HEADERS
+
+
+# Built once at import, read-only so callers can share it without copying
+_HEADERS = MappingProxyType({
+    'X-LLMur-Key': Config.API_KEY,
+    'Content-Type': 'application/json'
+})
@@ -1,122 +1,190 @@
-import uuid
+import atexit
+import itertools
+import os
+import secrets
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Dict, NamedTuple, Tuple
 from api_client import APIClient
 from config import Config
 
+# Set by pytest-xdist, keeps fixed names and emails distinct between parallel workers
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+
+# Id that never exists on the server, for not found and invalid reference checks
+SAMPLE_UUID = "07849650-088f-43ba-9062-757b85c000e1"
+
+# Names built from the process id and a counter stay unique across xdist workers without drawing
+# entropy per name; the short token set once per process keeps a rerun from reusing a recycled pid's names
+_NAME_COUNTER = itertools.count()
+_NAME_RUN = f"{os.getpid()}-{secrets.token_hex(2)}"
+
+
+def unique_name(prefix):
+    """Return `prefix` followed by a suffix no other call in this run produces"""
+    return f"{prefix}-{_NAME_RUN}-{next(_NAME_COUNTER)}"
+
+
+# Independent fixture requests are dispatched concurrently over the shared session
+_FIXTURE_POOL = ThreadPoolExecutor(max_workers=4)
+atexit.register(_FIXTURE_POOL.shutdown)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--thorough",
+        action="store_true",
+        help="Re-check after each delete that the entity is gone (nightly runs)",
+    )
+    parser.addoption(
+        "--use-requests-cache",
+        action="store_true",
+        help="Answer repeated GETs from an in-memory cache that every write clears (local runs)",
+    )
+
 
 @pytest.fixture(scope="session")
-def api_client():
-    """Shared API client for all tests"""
-    return APIClient()
+def thorough(request):
+    """Whether the extra post-delete verification GETs should run"""
+    return request.config.getoption("--thorough")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def api_client(request):
+    """Shared API client for all tests.
+
+    Must stay session scoped: the client owns the connection pool, a narrower
+    scope would drop and re-open connections between tests.
+    """
+    client = APIClient(cache=request.config.getoption("--use-requests-cache"))
+    client.warm_up()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def cached_api_client(request, api_client):
+    """The client --use-requests-cache runs the suite with, for auth tests that must hold with the cache on.
+
+    Reuses api_client when the option is set, otherwise keeps its own caching client
+    so these checks run on every invocation.
+    """
+    if request.config.getoption("--use-requests-cache"):
+        yield api_client
+        return
+    client = APIClient(cache=True)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
 def sample_uuid():
     """Sample uuid string. Used for invalid id validations"""
-    return "07849650-088f-43ba-9062-757b85c000e1"
+    return SAMPLE_UUID
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user_data():
-    """Sample user data for testing"""
-    return {
-        "name": "Test User",
-        "email": "test@example.com",
-        "password": "Hello1234",
-        "role": "admin"
-    }
+    """Factory of sample user data, each call with an email no other user in this run has"""
+    def make():
+        return {
+            "name": "Test User",
+            "email": f"{unique_name('test')}@example.com",
+            "password": "Hello1234",
+            "role": "admin"
+        }
 
+    return make
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_project_data():
     """Sample project data for testing"""
-    return {
+    return MappingProxyType({
         "name": "Test Project"
-    }
-
-
-@pytest.fixture
-def sample_membership_data():
-    """Sample membership data for testing"""
-    return {
-        "user_id": 1,
-        "project_id": 1,
-        "role": "admin"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_azure_openai_connection_data():
     """Sample connection data for testing"""
-    return {
+    return MappingProxyType({
         "provider": "azure/openai",
         "deployment_name": "gpt-4o",
         "api_endpoint": "https://aoairesource.openai.azure.com",
         "api_key": "dummy-key",
         "api_version": "2024-10-21"
-    }
+    })
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_openai_connection_data():
     """Sample OpenAI connection data for testing"""
-    return {
+    return MappingProxyType({
         "provider": "openai/v1",
         "model": "gpt-4o-mini",
         "api_endpoint": "https://api.openai.com",
         "api_key": "sk-test-openai",
-    }
+    })
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_gemini_connection_data():
     """Sample Gemini connection data for testing"""
-    return {
+    return MappingProxyType({
         "provider": "gemini",
         "model": "gemini-1.5-flash",
         "api_endpoint": "https://generativelanguage.googleapis.com",
         "api_key": "test-gemini-key",
         "api_version": "v1beta",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_deployment_data():
     """Sample deployment data for testing"""
-    return {
-        "name": "my-deployment",
+    return MappingProxyType({
+        "name": f"my-deployment-{WORKER_ID}",
         "access": "public"
-    }
+    })
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_virtual_key_data():
     """Sample deployment data for testing"""
-    return {
+    return MappingProxyType({
         "alias": "my-super-key",
         "project_id": 1
-    }
+    })
 
-@pytest.fixture
-def sample_connection_deployment_map_data():
-    """Sample connection <-> deployment map data for testing"""
-    return {
-        "connection_id": 1,
-        "deployment_id": 1,
-    }
+@pytest.fixture(scope="module")
+def sample_virtual_key_deployment_map_data(created_virtual_key, created_deployment):
+    """Sample virtual_key <-> deployment map data for testing"""
+    return MappingProxyType({
+        "virtual_key_id": created_virtual_key,
+        "deployment_id": created_deployment,
+    })
 
 
 @pytest.fixture
-def sample_virtual_key_deployment_map_data():
-    """Sample virtual_key <-> deployment map data for testing"""
-    return {
-        "virtual_key_id": 1,
-        "deployment_id": 1,
-    }
+def fresh_virtual_key_deployment_map_data(created_virtual_key, fresh_deployment):
+    """Virtual_key <-> deployment map data on a deployment of its own, for tests that create the map themselves"""
+    return MappingProxyType({
+        "virtual_key_id": created_virtual_key,
+        "deployment_id": fresh_deployment,
+    })
 
 
-@pytest.fixture
-def created_user(api_client, sample_user_data):
+@pytest.fixture(scope="session")
+def created_user_data(sample_user_data):
+    """Payload created_user is created from, for tests that need its email"""
+    return MappingProxyType(sample_user_data())
+
+
+@pytest.fixture(scope="session")
+def created_user(api_client, created_user_data):
     """Create a user for testing and clean up after"""
-    response = api_client.create_user(sample_user_data)
+    response = api_client.create_user(created_user_data)
     assert response.status_code == 200
-    user_id = response.json()['id']
+    user_id = api_client.json_body(response)['id']
 
     yield user_id
 
@@ -124,11 +192,11 @@ def created_user(api_client, sample_user_data):
     api_client.delete_user(user_id)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def created_user_with_password(api_client):
     """Create a user with a known password for auth tests and clean up after"""
     password = "Hello1234"
-    email = f"test-{uuid.uuid4().hex[:8]}@example.com"
+    email = f"test-{secrets.token_hex(4)}@example.com"
     payload = {
         "name": "Auth User",
         "email": email,
@@ -137,7 +205,7 @@ def created_user_with_password(api_client):
     }
     response = api_client.create_user(payload)
     assert response.status_code == 200
-    user_id = response.json()['id']
+    user_id = api_client.json_body(response)['id']
 
     yield {
         "id": user_id,
@@ -148,24 +216,94 @@ def created_user_with_password(api_client):
     api_client.delete_user(user_id)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def authed_session(api_client, created_user_with_password):
+    """Log created_user_with_password in once and share the token, for tests that only consume it"""
+    response = api_client.create_session_token({
+        "email": created_user_with_password["email"],
+        "password": created_user_with_password["password"],
+    })
+    assert response.status_code == 200
+    return SimpleNamespace(
+        user=created_user_with_password,
+        user_id=created_user_with_password["id"],
+        token=api_client.json_body(response)["token"],
+    )
+
+
+@pytest.fixture(scope="session")
 def created_project(api_client, sample_project_data):
     """Create a project for testing and clean up after"""
     response = api_client.create_project(sample_project_data)
     assert response.status_code == 200
-    project_id = response.json()['id']
+    project_id = api_client.json_body(response)['id']
 
     yield project_id
 
     # Cleanup
     api_client.delete_project(project_id)
 
+
+@pytest.fixture
+def fresh_project(api_client, sample_project_data):
+    """Create a project scoped to a single test, for tests that must not leave state on the shared project"""
+    response = api_client.create_project(sample_project_data)
+    assert response.status_code == 200
+    project_id = api_client.json_body(response)['id']
+
+    yield project_id
+
+    # Cleanup
+    api_client.delete_project(project_id)
+
+
+class _CleanupRegistry:
+    """Entities created by tests, deleted together when the session ends"""
+
+    def __init__(self):
+        self.entries = []
+
+    def add(self, kind, entity_id):
+        """Defer deleting `entity_id` through the client's `delete_<kind>` method"""
+        self.entries.append((kind, entity_id))
+
+
+@pytest.fixture(scope="session")
+def cleanup_registry(api_client):
+    """Collect ids to delete in one concurrent pass at session end instead of inline in each test"""
+    registry = _CleanupRegistry()
+
+    yield registry
+
+    # Every foreign key cascades, so the order does not matter and an already removed row just answers 404
+    _run_concurrently(*[
+        (getattr(api_client, f"delete_{kind}"), entity_id) for kind, entity_id in registry.entries
+    ])
+
+
 @pytest.fixture
+def membership_factory(api_client):
+    """Create memberships on demand and delete every one that was created, together, after the test"""
+    created = []
+
+    def make(**membership_data):
+        response = api_client.create_membership(membership_data)
+        if response.status_code == 200:
+            created.append(api_client.json_body(response)['id'])
+        return response
+
+    yield make
+
+    # Cleanup, a membership the test already deleted just answers 404
+    _run_concurrently(*[(api_client.delete_membership, membership_id) for membership_id in created])
+
+
+@pytest.fixture(scope="module")
 def created_azure_openai_connection(api_client, sample_azure_openai_connection_data):
     """Create a connection for testing and clean up after"""
     response = api_client.create_connection(sample_azure_openai_connection_data)
     assert response.status_code == 200
-    connection_id = response.json()['id']
+    connection_id = api_client.json_body(response)['id']
 
     yield connection_id
 
@@ -173,46 +311,42 @@ def created_azure_openai_connection(api_client, sample_azure_openai_connection_d
     api_client.delete_connection(connection_id)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def created_deployment(api_client, sample_deployment_data):
     """Create a deployment for testing and clean up after"""
-    response = api_client.create_deployment(sample_deployment_data)
+    # Deployment names are unique and this one outlives tests that create sample_deployment_data
+    payload = {**sample_deployment_data, "name": f"{sample_deployment_data['name']}-{secrets.token_hex(4)}"}
+    response = api_client.create_deployment(payload)
     assert response.status_code == 200
-    deployment_id = response.json()['id']
+    deployment_id = api_client.json_body(response)['id']
 
     yield deployment_id
 
     # Cleanup
     api_client.delete_deployment(deployment_id)
 
-@pytest.fixture
-def created_connection_deployment_map(api_client, created_azure_openai_connection, created_deployment):
-    """Create a connection <-> deployment map for testing and clean up after"""
-    payload = {
-        'connection_id': created_azure_openai_connection,
-        'deployment_id': created_deployment
-    }
 
-    cd_map = api_client.create_connection_deployment_map(payload)
-    assert cd_map.status_code == 200
-    cd_map_id = cd_map.json()['id']
+@pytest.fixture
+def fresh_deployment(api_client, sample_deployment_data):
+    """Create a deployment scoped to a single test, for tests that map it and must not clash with shared maps"""
+    payload = {**sample_deployment_data, "name": f"{sample_deployment_data['name']}-{secrets.token_hex(4)}"}
+    response = api_client.create_deployment(payload)
+    assert response.status_code == 200
+    deployment_id = api_client.json_body(response)['id']
 
-    yield cd_map_id
+    yield deployment_id
 
     # Cleanup
-    api_client.delete_connection_deployment_map(cd_map_id)
-
+    api_client.delete_deployment(deployment_id)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def created_virtual_key(api_client, sample_virtual_key_data, created_project):
-    """Create a deployment for testing and clean up after"""
-    payload = sample_virtual_key_data
-    sample_virtual_key_data['project_id'] = created_project
-
+    """Create a virtual key for testing and clean up after"""
+    payload = {**sample_virtual_key_data, "project_id": created_project}
     response = api_client.create_virtual_key(payload)
     assert response.status_code == 200
-    key_id = response.json()['id']
+    key_id = api_client.json_body(response)['id']
 
     yield key_id
 
@@ -220,7 +354,7 @@ def created_virtual_key(api_client, sample_virtual_key_data, created_project):
     api_client.delete_virtual_key(key_id)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def created_virtual_key_deployment_map(api_client, created_virtual_key, created_deployment):
     """Create a Virtual Key <-> Deployment map for testing and clean up after"""
     payload = {
@@ -230,7 +364,7 @@ def created_virtual_key_deployment_map(api_client, created_virtual_key, created_
 
     vkd_map = api_client.create_virtual_key_deployment_map(payload)
     assert vkd_map.status_code == 200
-    vkd_map_id = vkd_map.json()['id']
+    vkd_map_id = api_client.json_body(vkd_map)['id']
 
     yield vkd_map_id
 
@@ -238,43 +372,59 @@ def created_virtual_key_deployment_map(api_client, created_virtual_key, created_
     api_client.delete_virtual_key_deployment_map(vkd_map_id)
 
 
+def ok_json(response, status=200):
+    """Assert the response status and return its body decoded with orjson"""
+    assert response.status_code == status
+    return APIClient.json_body(response)
+
+
 def _provider_ready(values):
     return all(value is not None and str(value).strip() for value in values)
 
 
+def _run_concurrently(*calls, pool=_FIXTURE_POOL):
+    """Run independent (function, *args) calls on the fixture pool and return their results in order"""
+    futures = [pool.submit(fn, *args) for fn, *args in calls]
+    return [future.result() for future in futures]
+
+
 def _create_provider_setup(api_client, project_id, deployment_name, connection_payload):
-    deployment_resp = api_client.create_deployment({
-        "name": deployment_name,
-        "access": "public",
-    })
+    deployment_resp, connection_resp, key_resp = _run_concurrently(
+        (api_client.create_deployment, {
+            "name": deployment_name,
+            "access": "public",
+        }),
+        (api_client.create_connection, connection_payload),
+        (api_client.create_virtual_key, {
+            "project_id": project_id,
+        }),
+    )
     assert deployment_resp.status_code == 200
-    deployment_id = deployment_resp.json()['id']
+    deployment_id = api_client.json_body(deployment_resp)['id']
 
-    connection_resp = api_client.create_connection(connection_payload)
     assert connection_resp.status_code == 200
-    connection_id = connection_resp.json()['id']
-
-    map_resp = api_client.create_connection_deployment_map({
-        "connection_id": connection_id,
-        "deployment_id": deployment_id,
-    })
-    assert map_resp.status_code == 200
-    connection_deployment_id = map_resp.json()['id']
+    connection_id = api_client.json_body(connection_resp)['id']
 
-    key_resp = api_client.create_virtual_key({
-        "project_id": project_id,
-    })
     assert key_resp.status_code == 200
-    key_payload = key_resp.json()
+    key_payload = api_client.json_body(key_resp)
     virtual_key_id = key_payload['id']
     virtual_key = key_payload['key']
 
-    vkd_resp = api_client.create_virtual_key_deployment_map({
-        "virtual_key_id": virtual_key_id,
-        "deployment_id": deployment_id,
-    })
+    map_resp, vkd_resp = _run_concurrently(
+        (api_client.create_connection_deployment_map, {
+            "connection_id": connection_id,
+            "deployment_id": deployment_id,
+        }),
+        (api_client.create_virtual_key_deployment_map, {
+            "virtual_key_id": virtual_key_id,
+            "deployment_id": deployment_id,
+        }),
+    )
+    assert map_resp.status_code == 200
+    connection_deployment_id = api_client.json_body(map_resp)['id']
+
     assert vkd_resp.status_code == 200
-    virtual_key_deployment_id = vkd_resp.json()['id']
+    virtual_key_deployment_id = api_client.json_body(vkd_resp)['id']
 
     return {
         "deployment_id": deployment_id,
@@ -288,288 +438,225 @@ def _create_provider_setup(api_client, project_id, deployment_name, connection_p
 
 
 def _cleanup_provider_setup(api_client, setup):
-    api_client.delete_virtual_key_deployment_map(setup["virtual_key_deployment_id"])
-    api_client.delete_virtual_key(setup["virtual_key_id"])
-    api_client.delete_connection_deployment_map(setup["connection_deployment_id"])
-    api_client.delete_deployment(setup["deployment_id"])
-    api_client.delete_connection(setup["connection_id"])
-
-
-@pytest.fixture
-def openai_chat_provider_setup(api_client, created_project):
-    if not _provider_ready([Config.OPENAI_API_KEY, Config.OPENAI_CHAT_COMPLETIONS_MODEL]):
-        pytest.skip("OPENAI_API_KEY/OPENAI_CHAT_COMPLETIONS_MODEL not configured")
-
-    deployment_name = f"openai-chat-{uuid.uuid4().hex[:8]}"
-    setup = _create_provider_setup(api_client, created_project, deployment_name, {
-        "provider": "openai/v1",
-        "model": Config.OPENAI_CHAT_COMPLETIONS_MODEL,
-        "api_endpoint": Config.OPENAI_BASE_URL,
-        "api_key": Config.OPENAI_API_KEY,
-    })
-
-    yield setup
-
-    _cleanup_provider_setup(api_client, setup)
-
-
-@pytest.fixture
-def openai_embeddings_provider_setup(api_client, created_project):
-    if not _provider_ready([Config.OPENAI_API_KEY, Config.OPENAI_EMBEDDINGS_MODEL]):
-        pytest.skip("OPENAI_API_KEY/OPENAI_EMBEDDINGS_MODEL not configured")
-
-    deployment_name = f"openai-emb-{uuid.uuid4().hex[:8]}"
-    setup = _create_provider_setup(api_client, created_project, deployment_name, {
+    # Maps go first, the entities they point to are then independent of each other
+    _run_concurrently(
+        (api_client.delete_virtual_key_deployment_map, setup["virtual_key_deployment_id"]),
+        (api_client.delete_connection_deployment_map, setup["connection_deployment_id"]),
+    )
+    _run_concurrently(
+        (api_client.delete_virtual_key, setup["virtual_key_id"]),
+        (api_client.delete_deployment, setup["deployment_id"]),
+        (api_client.delete_connection, setup["connection_id"]),
+    )
+
+
+def _openai_connection(model):
+    return {
         "provider": "openai/v1",
-        "model": Config.OPENAI_EMBEDDINGS_MODEL,
+        "model": model,
         "api_endpoint": Config.OPENAI_BASE_URL,
         "api_key": Config.OPENAI_API_KEY,
-    })
-
-    yield setup
-
-    _cleanup_provider_setup(api_client, setup)
-
-
-@pytest.fixture
-def azure_chat_provider_setup(api_client, created_project):
-    if not _provider_ready([
-        Config.AZURE_OPENAI_API_KEY,
-        Config.AZURE_OPENAI_ENDPOINT,
-        Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT,
-    ]):
-        pytest.skip("Azure OpenAI chat config not fully set")
-
-    deployment_name = f"azure-chat-{uuid.uuid4().hex[:8]}"
-    setup = _create_provider_setup(api_client, created_project, deployment_name, {
-        "provider": "azure/openai",
-        "deployment_name": Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT,
-        "api_endpoint": Config.AZURE_OPENAI_ENDPOINT,
-        "api_key": Config.AZURE_OPENAI_API_KEY,
-        "api_version": Config.AZURE_OPENAI_API_VERSION,
-    })
-
-    yield setup
-
-    _cleanup_provider_setup(api_client, setup)
-
-
-@pytest.fixture
-def azure_embeddings_provider_setup(api_client, created_project):
-    if not _provider_ready([
-        Config.AZURE_OPENAI_API_KEY,
-        Config.AZURE_OPENAI_ENDPOINT,
-        Config.AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT,
-    ]):
-        pytest.skip("Azure OpenAI embeddings config not fully set")
-
-    deployment_name = f"azure-emb-{uuid.uuid4().hex[:8]}"
-    setup = _create_provider_setup(api_client, created_project, deployment_name, {
-        "provider": "azure/openai",
-        "deployment_name": Config.AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT,
-        "api_endpoint": Config.AZURE_OPENAI_ENDPOINT,
-        "api_key": Config.AZURE_OPENAI_API_KEY,
-        "api_version": Config.AZURE_OPENAI_API_VERSION,
-    })
-
-    yield setup
-
-    _cleanup_provider_setup(api_client, setup)
-
-
-@pytest.fixture
-def gemini_chat_provider_setup(api_client, created_project):
-    if not _provider_ready([
-        Config.GEMINI_API_KEY,
-        Config.GEMINI_CHAT_COMPLETIONS_MODEL,
-    ]):
-        pytest.skip("GEMINI_API_KEY/GEMINI_CHAT_COMPLETIONS_MODEL not configured")
-
-    deployment_name = f"gemini-chat-{uuid.uuid4().hex[:8]}"
-    setup = _create_provider_setup(api_client, created_project, deployment_name, {
-        "provider": "gemini",
-        "model": Config.GEMINI_CHAT_COMPLETIONS_MODEL,
-        "api_endpoint": Config.GEMINI_BASE_URL,
-        "api_key": Config.GEMINI_API_KEY,
-        "api_version": Config.GEMINI_API_VERSION,
-    })
-
-    yield setup
-
-    _cleanup_provider_setup(api_client, setup)
-
-
-@pytest.fixture
-def gemini_embeddings_provider_setup(api_client, created_project):
-    if not _provider_ready([
-        Config.GEMINI_API_KEY,
-        Config.GEMINI_EMBEDDINGS_MODEL,
-    ]):
-        pytest.skip("GEMINI_API_KEY/GEMINI_EMBEDDINGS_MODEL not configured")
-
-    deployment_name = f"gemini-emb-{uuid.uuid4().hex[:8]}"
-    setup = _create_provider_setup(api_client, created_project, deployment_name, {
-        "provider": "gemini",
-        "model": Config.GEMINI_EMBEDDINGS_MODEL,
-        "api_endpoint": Config.GEMINI_BASE_URL,
-        "api_key": Config.GEMINI_API_KEY,
-        "api_version": Config.GEMINI_API_VERSION,
-    })
-
-    yield setup
-
-    _cleanup_provider_setup(api_client, setup)
-
-
-@pytest.fixture
-def azure_chat_invalid_provider_setup(api_client, created_project):
-    if not _provider_ready([
-        Config.AZURE_OPENAI_API_KEY,
-        Config.AZURE_OPENAI_ENDPOINT,
-        Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT,
-    ]):
-        pytest.skip("Azure OpenAI chat config not fully set")
-
-    invalid_deployment = f"{Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT}-invalid-{uuid.uuid4().hex[:6]}"
-    deployment_name = f"azure-chat-invalid-{uuid.uuid4().hex[:8]}"
-    setup = _create_provider_setup(api_client, created_project, deployment_name, {
-        "provider": "azure/openai",
-        "deployment_name": invalid_deployment,
-        "api_endpoint": Config.AZURE_OPENAI_ENDPOINT,
-        "api_key": Config.AZURE_OPENAI_API_KEY,
-        "api_version": Config.AZURE_OPENAI_API_VERSION,
-    })
-
-    yield setup
-
-    _cleanup_provider_setup(api_client, setup)
+    }
 
 
-@pytest.fixture
-def azure_embeddings_invalid_provider_setup(api_client, created_project):
-    if not _provider_ready([
-        Config.AZURE_OPENAI_API_KEY,
-        Config.AZURE_OPENAI_ENDPOINT,
-        Config.AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT,
-    ]):
-        pytest.skip("Azure OpenAI embeddings config not fully set")
-
-    invalid_deployment = f"{Config.AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT}-invalid-{uuid.uuid4().hex[:6]}"
-    deployment_name = f"azure-emb-invalid-{uuid.uuid4().hex[:8]}"
-    setup = _create_provider_setup(api_client, created_project, deployment_name, {
+def _azure_connection(deployment_name):
+    return {
         "provider": "azure/openai",
-        "deployment_name": invalid_deployment,
+        "deployment_name": deployment_name,
         "api_endpoint": Config.AZURE_OPENAI_ENDPOINT,
         "api_key": Config.AZURE_OPENAI_API_KEY,
         "api_version": Config.AZURE_OPENAI_API_VERSION,
-    })
-
-    yield setup
-
-    _cleanup_provider_setup(api_client, setup)
-
-
-@pytest.fixture
-def gemini_chat_invalid_provider_setup(api_client, created_project):
-    if not _provider_ready([
-        Config.GEMINI_API_KEY,
-        Config.GEMINI_CHAT_COMPLETIONS_MODEL,
-    ]):
-        pytest.skip("GEMINI_API_KEY/GEMINI_CHAT_COMPLETIONS_MODEL not configured")
-
-    invalid_model = f"{Config.GEMINI_CHAT_COMPLETIONS_MODEL}-invalid-{uuid.uuid4().hex[:6]}"
-    deployment_name = f"gemini-chat-invalid-{uuid.uuid4().hex[:8]}"
-    setup = _create_provider_setup(api_client, created_project, deployment_name, {
-        "provider": "gemini",
-        "model": invalid_model,
-        "api_endpoint": Config.GEMINI_BASE_URL,
-        "api_key": Config.GEMINI_API_KEY,
-        "api_version": Config.GEMINI_API_VERSION,
-    })
-
-    yield setup
-
-    _cleanup_provider_setup(api_client, setup)
+    }
 
 
-@pytest.fixture
-def gemini_embeddings_invalid_provider_setup(api_client, created_project):
-    if not _provider_ready([
-        Config.GEMINI_API_KEY,
-        Config.GEMINI_EMBEDDINGS_MODEL,
-    ]):
-        pytest.skip("GEMINI_API_KEY/GEMINI_EMBEDDINGS_MODEL not configured")
-
-    invalid_model = f"{Config.GEMINI_EMBEDDINGS_MODEL}-invalid-{uuid.uuid4().hex[:6]}"
-    deployment_name = f"gemini-emb-invalid-{uuid.uuid4().hex[:8]}"
-    setup = _create_provider_setup(api_client, created_project, deployment_name, {
+def _gemini_connection(model):
+    return {
         "provider": "gemini",
-        "model": invalid_model,
+        "model": model,
         "api_endpoint": Config.GEMINI_BASE_URL,
         "api_key": Config.GEMINI_API_KEY,
         "api_version": Config.GEMINI_API_VERSION,
-    })
-
-    yield setup
-
-    _cleanup_provider_setup(api_client, setup)
+    }
 
 
-@pytest.fixture
+class ProviderSpec(NamedTuple):
+    required: Tuple[Any, ...]
+    skip_reason: str
+    prefix: str
+    connection_payload: Callable[[], Dict[str, Any]]
+
+
+_OPENAI_CHAT = (Config.OPENAI_API_KEY, Config.OPENAI_CHAT_COMPLETIONS_MODEL)
+_OPENAI_EMBEDDINGS = (Config.OPENAI_API_KEY, Config.OPENAI_EMBEDDINGS_MODEL)
+_AZURE_CHAT = (Config.AZURE_OPENAI_API_KEY, Config.AZURE_OPENAI_ENDPOINT, Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT)
+_AZURE_EMBEDDINGS = (Config.AZURE_OPENAI_API_KEY, Config.AZURE_OPENAI_ENDPOINT, Config.AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT)
+_GEMINI_CHAT = (Config.GEMINI_API_KEY, Config.GEMINI_CHAT_COMPLETIONS_MODEL)
+_GEMINI_EMBEDDINGS = (Config.GEMINI_API_KEY, Config.GEMINI_EMBEDDINGS_MODEL)
+
+# Keyed by fixture name without the "_provider_setup" suffix
+PROVIDER_SPECS = {
+    "openai_chat": ProviderSpec(
+        required=_OPENAI_CHAT,
+        skip_reason="OPENAI_API_KEY/OPENAI_CHAT_COMPLETIONS_MODEL not configured",
+        prefix="openai-chat",
+        connection_payload=lambda: _openai_connection(Config.OPENAI_CHAT_COMPLETIONS_MODEL),
+    ),
+    "openai_embeddings": ProviderSpec(
+        required=_OPENAI_EMBEDDINGS,
+        skip_reason="OPENAI_API_KEY/OPENAI_EMBEDDINGS_MODEL not configured",
+        prefix="openai-emb",
+        connection_payload=lambda: _openai_connection(Config.OPENAI_EMBEDDINGS_MODEL),
+    ),
+    "azure_chat": ProviderSpec(
+        required=_AZURE_CHAT,
+        skip_reason="Azure OpenAI chat config not fully set",
+        prefix="azure-chat",
+        connection_payload=lambda: _azure_connection(Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT),
+    ),
+    "azure_embeddings": ProviderSpec(
+        required=_AZURE_EMBEDDINGS,
+        skip_reason="Azure OpenAI embeddings config not fully set",
+        prefix="azure-emb",
+        connection_payload=lambda: _azure_connection(Config.AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT),
+    ),
+    "gemini_chat": ProviderSpec(
+        required=_GEMINI_CHAT,
+        skip_reason="GEMINI_API_KEY/GEMINI_CHAT_COMPLETIONS_MODEL not configured",
+        prefix="gemini-chat",
+        connection_payload=lambda: _gemini_connection(Config.GEMINI_CHAT_COMPLETIONS_MODEL),
+    ),
+    "gemini_embeddings": ProviderSpec(
+        required=_GEMINI_EMBEDDINGS,
+        skip_reason="GEMINI_API_KEY/GEMINI_EMBEDDINGS_MODEL not configured",
+        prefix="gemini-emb",
+        connection_payload=lambda: _gemini_connection(Config.GEMINI_EMBEDDINGS_MODEL),
+    ),
+    "azure_chat_invalid": ProviderSpec(
+        required=_AZURE_CHAT,
+        skip_reason="Azure OpenAI chat config not fully set",
+        prefix="azure-chat-invalid",
+        connection_payload=lambda: _azure_connection(
+            f"{Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT}-invalid-{secrets.token_hex(3)}"
+        ),
+    ),
+    "azure_embeddings_invalid": ProviderSpec(
+        required=_AZURE_EMBEDDINGS,
+        skip_reason="Azure OpenAI embeddings config not fully set",
+        prefix="azure-emb-invalid",
+        connection_payload=lambda: _azure_connection(
+            f"{Config.AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT}-invalid-{secrets.token_hex(3)}"
+        ),
+    ),
+    "gemini_chat_invalid": ProviderSpec(
+        required=_GEMINI_CHAT,
+        skip_reason="GEMINI_API_KEY/GEMINI_CHAT_COMPLETIONS_MODEL not configured",
+        prefix="gemini-chat-invalid",
+        connection_payload=lambda: _gemini_connection(
+            f"{Config.GEMINI_CHAT_COMPLETIONS_MODEL}-invalid-{secrets.token_hex(3)}"
+        ),
+    ),
+    "gemini_embeddings_invalid": ProviderSpec(
+        required=_GEMINI_EMBEDDINGS,
+        skip_reason="GEMINI_API_KEY/GEMINI_EMBEDDINGS_MODEL not configured",
+        prefix="gemini-emb-invalid",
+        connection_payload=lambda: _gemini_connection(
+            f"{Config.GEMINI_EMBEDDINGS_MODEL}-invalid-{secrets.token_hex(3)}"
+        ),
+    ),
+}
+
+# Config is read from the environment once at import, so readiness never changes mid session
+PROVIDER_READY = {kind: _provider_ready(spec.required) for kind, spec in PROVIDER_SPECS.items()}
+
+
+def _provider_setup_fixture(kind, scope="module"):
+    """Build the `<kind>_provider_setup` fixture described by PROVIDER_SPECS[kind]"""
+    spec = PROVIDER_SPECS[kind]
+
+    @pytest.fixture(name=f"{kind}_provider_setup", scope=scope)
+    def provider_setup(api_client, created_project):
+        if not PROVIDER_READY[kind]:
+            pytest.skip(spec.skip_reason)
+
+        deployment_name = f"{spec.prefix}-{secrets.token_hex(4)}"
+        setup = _create_provider_setup(api_client, created_project, deployment_name, spec.connection_payload())
+
+        yield setup
+
+        _cleanup_provider_setup(api_client, setup)
+
+    return provider_setup
+
+
+openai_chat_provider_setup = _provider_setup_fixture("openai_chat")
+openai_embeddings_provider_setup = _provider_setup_fixture("openai_embeddings", scope="session")
+azure_chat_provider_setup = _provider_setup_fixture("azure_chat")
+azure_embeddings_provider_setup = _provider_setup_fixture("azure_embeddings", scope="session")
+gemini_chat_provider_setup = _provider_setup_fixture("gemini_chat")
+gemini_embeddings_provider_setup = _provider_setup_fixture("gemini_embeddings", scope="session")
+azure_chat_invalid_provider_setup = _provider_setup_fixture("azure_chat_invalid")
+azure_embeddings_invalid_provider_setup = _provider_setup_fixture("azure_embeddings_invalid")
+gemini_chat_invalid_provider_setup = _provider_setup_fixture("gemini_chat_invalid")
+gemini_embeddings_invalid_provider_setup = _provider_setup_fixture("gemini_embeddings_invalid")
+
+
+# Module scoped like the other provider setups; its one request per day budget is spent by
+# the first consumer, so only a single test should use it
+@pytest.fixture(scope="module")
 def azure_chat_rate_limited_setup(api_client):
-    if not _provider_ready([
-        Config.AZURE_OPENAI_API_KEY,
-        Config.AZURE_OPENAI_ENDPOINT,
-        Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT,
-    ]):
-        pytest.skip("Azure OpenAI chat config not fully set")
-
-    project_resp = api_client.create_project({
-        "name": f"rl-project-{uuid.uuid4().hex[:8]}",
-        "request_limits": {"requests_per_day": 1},
-    })
+    if not PROVIDER_READY["azure_chat"]:
+        pytest.skip(PROVIDER_SPECS["azure_chat"].skip_reason)
+
+    deployment_name = f"rl-deployment-{secrets.token_hex(4)}"
+    project_resp, deployment_resp, connection_resp = _run_concurrently(
+        (api_client.create_project, {
+            "name": f"rl-project-{secrets.token_hex(4)}",
+            "request_limits": {"requests_per_day": 1},
+        }),
+        (api_client.create_deployment, {
+            "name": deployment_name,
+            "access": "public",
+            "request_limits": {"requests_per_day": 1},
+        }),
+        (api_client.create_connection, {
+            "provider": "azure/openai",
+            "deployment_name": Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT,
+            "api_endpoint": Config.AZURE_OPENAI_ENDPOINT,
+            "api_key": Config.AZURE_OPENAI_API_KEY,
+            "api_version": Config.AZURE_OPENAI_API_VERSION,
+        }),
+    )
     assert project_resp.status_code == 200
-    project_id = project_resp.json()["id"]
+    project_id = api_client.json_body(project_resp)["id"]
 
-    deployment_name = f"rl-deployment-{uuid.uuid4().hex[:8]}"
-    deployment_resp = api_client.create_deployment({
-        "name": deployment_name,
-        "access": "public",
-        "request_limits": {"requests_per_day": 1},
-    })
     assert deployment_resp.status_code == 200
-    deployment_id = deployment_resp.json()["id"]
+    deployment_id = api_client.json_body(deployment_resp)["id"]
 
-    connection_resp = api_client.create_connection({
-        "provider": "azure/openai",
-        "deployment_name": Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT,
-        "api_endpoint": Config.AZURE_OPENAI_ENDPOINT,
-        "api_key": Config.AZURE_OPENAI_API_KEY,
-        "api_version": Config.AZURE_OPENAI_API_VERSION,
-    })
     assert connection_resp.status_code == 200
-    connection_id = connection_resp.json()["id"]
-
-    map_resp = api_client.create_connection_deployment_map({
-        "connection_id": connection_id,
-        "deployment_id": deployment_id,
-    })
+    connection_id = api_client.json_body(connection_resp)["id"]
+
+    map_resp, key_resp = _run_concurrently(
+        (api_client.create_connection_deployment_map, {
+            "connection_id": connection_id,
+            "deployment_id": deployment_id,
+        }),
+        (api_client.create_virtual_key, {
+            "project_id": project_id,
+            "request_limits": {"requests_per_day": 1},
+        }),
+    )
     assert map_resp.status_code == 200
-    connection_deployment_id = map_resp.json()["id"]
+    connection_deployment_id = api_client.json_body(map_resp)["id"]
 
-    key_resp = api_client.create_virtual_key({
-        "project_id": project_id,
-        "request_limits": {"requests_per_day": 1},
-    })
     assert key_resp.status_code == 200
-    key_payload = key_resp.json()
+    key_payload = api_client.json_body(key_resp)
 
     vkd_resp = api_client.create_virtual_key_deployment_map({
         "virtual_key_id": key_payload["id"],
         "deployment_id": deployment_id,
     })
     assert vkd_resp.status_code == 200
-    vkd_id = vkd_resp.json()["id"]
+    vkd_id = api_client.json_body(vkd_resp)["id"]
 
     yield {
         "project_id": project_id,
@@ -582,9 +669,13 @@ def azure_chat_rate_limited_setup(api_client):
         "virtual_key_deployment_id": vkd_id,
     }
 
-    api_client.delete_virtual_key_deployment_map(vkd_id)
-    api_client.delete_virtual_key(key_payload["id"])
-    api_client.delete_connection_deployment_map(connection_deployment_id)
-    api_client.delete_deployment(deployment_id)
-    api_client.delete_connection(connection_id)
+    _run_concurrently(
+        (api_client.delete_virtual_key_deployment_map, vkd_id),
+        (api_client.delete_connection_deployment_map, connection_deployment_id),
+    )
+    _run_concurrently(
+        (api_client.delete_virtual_key, key_payload["id"]),
+        (api_client.delete_deployment, deployment_id),
+        (api_client.delete_connection, connection_id),
+    )
     api_client.delete_project(project_id)
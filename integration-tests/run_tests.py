@@ -5,10 +5,13 @@ Usage: python run_tests.py [options]
 """
 
 import sys
-import subprocess
 import argparse
+import functools
 import os
 
+# Test files live next to this script, wherever it is run from
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Available test suites
 TEST_SUITES = {
     'all': [],  # Empty list means run all tests
@@ -20,8 +23,18 @@ TEST_SUITES = {
 }
 
 
-def run_tests(suite=None, test_file=None, pattern=None, verbose=False, html_report=False):
-    """Run the API integration tests"""
+@functools.lru_cache(maxsize=1)
+def _discover_tests():
+    """Names of the test files next to this script"""
+    return tuple(sorted(
+        entry.name for entry in os.scandir(_TESTS_DIR)
+        if entry.name.startswith('test_') and entry.name.endswith('.py')
+    ))
+
+
+def run_tests(suite=None, test_file=None, pattern=None, verbose=False, html_report=False, parallel='auto',
+              show_locals=False, fast=False, exitfirst=False):
+    """Run the API integration tests, replacing the current process with pytest"""
 
     cmd = [sys.executable, '-m', 'pytest']
 
@@ -40,6 +53,21 @@ def run_tests(suite=None, test_file=None, pattern=None, verbose=False, html_repo
     if verbose:
         cmd.append('-v')
 
+    if fast:
+        # Local dev loops only, without the cache provider --lf/--ff have nothing to work from
+        cmd.extend(['-p', 'no:cacheprovider', '--no-header', '--no-summary', '-q'])
+
+    if exitfirst:
+        cmd.append('-x')
+
+    if show_locals:
+        cmd.append('--showlocals')  # Show local variables in tracebacks
+
+    if parallel:
+        # loadfile keeps every test of a file on one worker, so module scoped fixtures
+        # and the rate limit test's request counter are never shared between workers
+        cmd.extend(['-n', str(parallel), '--dist=loadfile'])
+
     if html_report:
         # Create reports directory if it doesn't exist
         os.makedirs('reports', exist_ok=True)
@@ -48,17 +76,16 @@ def run_tests(suite=None, test_file=None, pattern=None, verbose=False, html_repo
     # Add useful pytest options
     cmd.extend([
         '--color=yes',  # Colored output
-        '-l',  # Show local variables in tracebacks
         '--tb=short',  # Shorter traceback format
         '--strict-markers',  # Strict marker checking
     ])
 
     print(f"Running command: {' '.join(cmd)}")
-    print(f"Available test files: {[f for f in os.listdir('.') if f.startswith('test_') and f.endswith('.py')]}")
+    print(f"Available test files: {list(_discover_tests())}")
 
-    result = subprocess.run(cmd)
-
-    return result.returncode
+    # Replace this process with pytest rather than keeping a second interpreter waiting on it
+    sys.stdout.flush()
+    os.execvp(cmd[0], cmd)
 
 
 def list_available_tests():
@@ -69,8 +96,7 @@ def list_available_tests():
         print(f"  {suite}: {file_list}")
 
     print("\nAvailable test files:")
-    test_files = [f for f in os.listdir('.') if f.startswith('test_') and f.endswith('.py')]
-    for test_file in test_files:
+    for test_file in _discover_tests():
         print(f"  {test_file}")
 
 
@@ -84,6 +110,9 @@ Examples:
   python run_tests.py --suite users      # Run only user tests
   python run_tests.py --file test_users.py # Run specific file
   python run_tests.py --pattern "create" # Run tests with "create" in name
+  python run_tests.py --parallel 4       # Run on 4 xdist workers
+  python run_tests.py -f test_users.py --fast # Quick local rerun of one file
+  python run_tests.py -k "not provider_gemini" -x # Skip Gemini tests, stop on first failure
   python run_tests.py --list             # Show available options
         '''
     )
@@ -94,6 +123,12 @@ Examples:
     parser.add_argument('--pattern', '-k', help='Run tests matching pattern')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--html', action='store_true', help='Generate HTML report')
+    parser.add_argument('--parallel', '-n', default='auto',
+                        help='Number of pytest-xdist workers, "auto" for one per CPU, 0 to run serially')
+    parser.add_argument('--exitfirst', '-x', action='store_true', help='Stop on the first failing test')
+    parser.add_argument('--show-locals', action='store_true', help='Show local variables in tracebacks')
+    parser.add_argument('--fast', action='store_true',
+                        help='Skip the pytest cache, header and summary for quick local reruns (not for CI)')
     parser.add_argument('--list', '-l', action='store_true', help='List available tests')
 
     args = parser.parse_args()
@@ -102,16 +137,18 @@ Examples:
         list_available_tests()
         return
 
-    exit_code = run_tests(
+    run_tests(
         suite=args.suite,
         test_file=args.file,
         pattern=args.pattern,
         verbose=args.verbose,
-        html_report=args.html
+        html_report=args.html,
+        parallel=args.parallel,
+        show_locals=args.show_locals,
+        fast=args.fast,
+        exitfirst=args.exitfirst
     )
 
-    sys.exit(exit_code)
-
 
 if __name__ == '__main__':
     main()
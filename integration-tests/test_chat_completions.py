@@ -1,29 +1,43 @@
-import json
+import orjson
 import time
 import pytest
-import requests
 from config import Config
 
+pytestmark = pytest.mark.integration
+
+
+_SSE_DATA_PREFIX = b"data:"
+_SSE_DATA_PREFIX_LEN = len(_SSE_DATA_PREFIX)
+_SSE_DONE = b"[DONE]"
+
+
+def _iter_sse_data(response):
+    """Yield the raw payload of every `data:` line, splitting the stream on bytes without decoding it"""
+    buf = b""
+    for chunk in response.iter_content(chunk_size=8192):
+        buf += chunk
+        while b"\n" in buf:
+            line, _, buf = buf.partition(b"\n")
+            if line.startswith(_SSE_DATA_PREFIX):
+                # strip() also drops the \r of CRLF line endings left by the split on \n
+                yield line[_SSE_DATA_PREFIX_LEN:].strip()
+    if buf.startswith(_SSE_DATA_PREFIX):
+        yield buf[_SSE_DATA_PREFIX_LEN:].strip()
+
 
 class TestChatCompletions:
     def _collect_sse_events(self, response, max_events=200):
         events = []
         done = False
 
-        for line in response.iter_lines(decode_unicode=True):
-            if not line:
-                continue
-            if not line.startswith("data:"):
-                continue
-
-            data = line[len("data:"):].strip()
-            if data == "[DONE]":
+        for data in _iter_sse_data(response):
+            if data == _SSE_DONE:
                 done = True
                 break
 
             try:
-                events.append(json.loads(data))
-            except json.JSONDecodeError:
+                events.append(orjson.loads(data))
+            except orjson.JSONDecodeError:
                 continue
 
             if len(events) >= max_events:
@@ -32,6 +46,50 @@ class TestChatCompletions:
         response.close()
         return events, done
 
+    def _fold_sse_events(self, response):
+        """Read the stream to `[DONE]` keeping only `(saw_choices, saw_usage, done)` instead of the events"""
+        saw_choices = False
+        saw_usage = False
+        done = False
+
+        for data in _iter_sse_data(response):
+            if data == _SSE_DONE:
+                done = True
+                break
+
+            try:
+                event = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                continue
+
+            saw_choices = saw_choices or bool(event.get("choices"))
+            saw_usage = saw_usage or bool(event.get("usage"))
+
+        response.close()
+        return saw_choices, saw_usage, done
+
+    def _start_stream(self, api_client, setup, *, include_usage=False):
+        """Open a chat completion stream through `setup` and check it is an event stream"""
+        payload = {
+            "model": setup["deployment_name"],
+            "messages": [{"role": "user", "content": "Hello"}],
+            "stream": True,
+        }
+        if include_usage:
+            payload["stream_options"] = {"include_usage": True}
+
+        response = api_client.stream_chat_completion(payload, setup["virtual_key"])
+
+        assert response.status_code == 200
+        assert "text/event-stream" in response.headers.get("content-type", "")
+        return response
+
+    def _open_stream(self, api_client, setup, *, include_usage=False, stop_after=None):
+        """Stream a chat completion through `setup` and return the collected `(events, done)`"""
+        response = self._start_stream(api_client, setup, include_usage=include_usage)
+        return self._collect_sse_events(response, max_events=stop_after or 200)
+
+    @pytest.mark.provider_openai
     def test_chat_completions_openai(self, api_client, openai_chat_provider_setup):
         """Test OpenAI provider chat completions (non-stream)"""
         payload = {
@@ -48,31 +106,16 @@ class TestChatCompletions:
         assert data.get("object")
         assert data["model"] == openai_chat_provider_setup["deployment_name"]
 
-    def test_chat_completions_openai_stream(self, openai_chat_provider_setup):
+    @pytest.mark.provider_openai
+    def test_chat_completions_openai_stream(self, api_client, openai_chat_provider_setup):
         """Test OpenAI provider chat completions (stream)"""
-        payload = {
-            "model": openai_chat_provider_setup["deployment_name"],
-            "messages": [{"role": "user", "content": "Hello"}],
-            "stream": True,
-            "stream_options": {"include_usage": True},
-        }
-        headers = {
-            "Authorization": f"Bearer {openai_chat_provider_setup['virtual_key']}",
-            "Content-Type": "application/json",
-        }
+        response = self._start_stream(api_client, openai_chat_provider_setup, include_usage=True)
 
-        response = requests.post(
-            f"{Config.BASE_URL}/v1/chat/completions",
-            headers=headers,
-            json=payload,
-            stream=True,
-            timeout=Config.TIMEOUT,
-        )
-
-        assert response.status_code == 200
-        assert "text/event-stream" in response.headers.get("content-type", "")
-        response.close()
+        saw_choices, _, done = self._fold_sse_events(response)
+        assert saw_choices
+        assert done
 
+    @pytest.mark.provider_azure
     def test_chat_completions_azure(self, api_client, azure_chat_provider_setup):
         """Test Azure OpenAI provider chat completions"""
         payload = {
@@ -89,6 +132,7 @@ class TestChatCompletions:
         assert data.get("object")
         assert data["model"] == azure_chat_provider_setup["deployment_name"]
 
+    @pytest.mark.provider_gemini
     def test_chat_completions_gemini(self, api_client, gemini_chat_provider_setup):
         """Test Gemini provider chat completions"""
         payload = {
@@ -105,6 +149,7 @@ class TestChatCompletions:
         assert data.get("object")
         assert data["model"] == Config.GEMINI_CHAT_COMPLETIONS_MODEL
 
+    @pytest.mark.provider_azure
     def test_chat_completions_complex_payload(self, api_client, azure_chat_provider_setup):
         """Test complex payload without response_format"""
         payload = {
@@ -123,6 +168,7 @@ class TestChatCompletions:
         data = response.json()
         assert data["choices"]
 
+    @pytest.mark.provider_openai
     def test_chat_completions_response_format_json_object(self, api_client, openai_chat_provider_setup):
         """Test response_format json_object returns valid JSON"""
         payload = {
@@ -144,185 +190,41 @@ class TestChatCompletions:
         data = response.json()
         content = data["choices"][0]["message"]["content"]
         assert content
-        json.loads(content)
+        orjson.loads(content)
 
-    def test_chat_completions_stream_no_usage(self, azure_chat_provider_setup):
+    @pytest.mark.provider_azure
+    def test_chat_completions_stream_no_usage(self, api_client, azure_chat_provider_setup):
         """Test streaming without usage requested"""
-        payload = {
-            "model": azure_chat_provider_setup["deployment_name"],
-            "messages": [{"role": "user", "content": "Hello"}],
-            "stream": True,
-        }
-        headers = {
-            "Authorization": f"Bearer {azure_chat_provider_setup['virtual_key']}",
-            "Content-Type": "application/json",
-        }
-
-        response = requests.post(
-            f"{Config.BASE_URL}/v1/chat/completions",
-            headers=headers,
-            json=payload,
-            stream=True,
-            timeout=Config.TIMEOUT,
-        )
-
-        assert response.status_code == 200
-        assert "text/event-stream" in response.headers.get("content-type", "")
-
-        events, done = self._collect_sse_events(response)
+        response = self._start_stream(api_client, azure_chat_provider_setup)
+        saw_choices, saw_usage, done = self._fold_sse_events(response)
         assert done is True
-        assert any(event.get("choices") for event in events)
-        assert not any(event.get("usage") for event in events if event.get("usage") is not None)
+        assert saw_choices
+        assert not saw_usage
 
-    def test_chat_completions_stream_with_usage(self, azure_chat_provider_setup):
+    @pytest.mark.provider_azure
+    def test_chat_completions_stream_with_usage(self, api_client, azure_chat_provider_setup):
         """Test streaming with usage requested"""
-        payload = {
-            "model": azure_chat_provider_setup["deployment_name"],
-            "messages": [{"role": "user", "content": "Hello"}],
-            "stream": True,
-            "stream_options": {"include_usage": True},
-        }
-        headers = {
-            "Authorization": f"Bearer {azure_chat_provider_setup['virtual_key']}",
-            "Content-Type": "application/json",
-        }
-
-        response = requests.post(
-            f"{Config.BASE_URL}/v1/chat/completions",
-            headers=headers,
-            json=payload,
-            stream=True,
-            timeout=Config.TIMEOUT,
-        )
-
-        assert response.status_code == 200
-        assert "text/event-stream" in response.headers.get("content-type", "")
-
-        events, done = self._collect_sse_events(response)
+        response = self._start_stream(api_client, azure_chat_provider_setup, include_usage=True)
+        saw_choices, saw_usage, done = self._fold_sse_events(response)
         assert done is True
-        assert any(event.get("choices") for event in events)
-        assert any(event.get("usage") for event in events if event.get("usage") is not None)
-
-    def test_chat_completions_stream_cancel_openai(self, openai_chat_provider_setup):
-        """Test canceling OpenAI stream early"""
-        payload = {
-            "model": openai_chat_provider_setup["deployment_name"],
-            "messages": [{"role": "user", "content": "Hello"}],
-            "stream": True,
-        }
-        headers = {
-            "Authorization": f"Bearer {openai_chat_provider_setup['virtual_key']}",
-            "Content-Type": "application/json",
-        }
-
-        response = requests.post(
-            f"{Config.BASE_URL}/v1/chat/completions",
-            headers=headers,
-            json=payload,
-            stream=True,
-            timeout=Config.TIMEOUT,
-        )
-
-        assert response.status_code == 200
-        assert "text/event-stream" in response.headers.get("content-type", "")
-
-        events = []
-        for line in response.iter_lines(decode_unicode=True):
-            if not line or not line.startswith("data:"):
-                continue
-            data = line[len("data:"):].strip()
-            if data == "[DONE]":
-                break
-            try:
-                events.append(json.loads(data))
-            except json.JSONDecodeError:
-                continue
-            if len(events) >= 2:
-                break
-
-        response.close()
-        assert events
-
-    def test_chat_completions_stream_cancel_azure(self, azure_chat_provider_setup):
-        """Test canceling Azure stream early"""
-        payload = {
-            "model": azure_chat_provider_setup["deployment_name"],
-            "messages": [{"role": "user", "content": "Hello"}],
-            "stream": True,
-        }
-        headers = {
-            "Authorization": f"Bearer {azure_chat_provider_setup['virtual_key']}",
-            "Content-Type": "application/json",
-        }
-
-        response = requests.post(
-            f"{Config.BASE_URL}/v1/chat/completions",
-            headers=headers,
-            json=payload,
-            stream=True,
-            timeout=Config.TIMEOUT,
-        )
-
-        assert response.status_code == 200
-        assert "text/event-stream" in response.headers.get("content-type", "")
-
-        events = []
-        for line in response.iter_lines(decode_unicode=True):
-            if not line or not line.startswith("data:"):
-                continue
-            data = line[len("data:"):].strip()
-            if data == "[DONE]":
-                break
-            try:
-                events.append(json.loads(data))
-            except json.JSONDecodeError:
-                continue
-            if len(events) >= 2:
-                break
-
-        response.close()
-        assert events
-
-    def test_chat_completions_stream_cancel_gemini(self, gemini_chat_provider_setup):
-        """Test canceling Gemini stream early"""
-        payload = {
-            "model": gemini_chat_provider_setup["deployment_name"],
-            "messages": [{"role": "user", "content": "Hello"}],
-            "stream": True,
-        }
-        headers = {
-            "Authorization": f"Bearer {gemini_chat_provider_setup['virtual_key']}",
-            "Content-Type": "application/json",
-        }
-
-        response = requests.post(
-            f"{Config.BASE_URL}/v1/chat/completions",
-            headers=headers,
-            json=payload,
-            stream=True,
-            timeout=Config.TIMEOUT,
-        )
-
-        assert response.status_code == 200
-        assert "text/event-stream" in response.headers.get("content-type", "")
-
-        events = []
-        for line in response.iter_lines(decode_unicode=True):
-            if not line or not line.startswith("data:"):
-                continue
-            data = line[len("data:"):].strip()
-            if data == "[DONE]":
-                break
-            try:
-                events.append(json.loads(data))
-            except json.JSONDecodeError:
-                continue
-            if len(events) >= 2:
-                break
-
-        response.close()
+        assert saw_choices
+        assert saw_usage
+
+    @pytest.mark.parametrize(
+        "provider_fixture",
+        [
+            pytest.param("openai_chat_provider_setup", id="openai", marks=pytest.mark.provider_openai),
+            pytest.param("azure_chat_provider_setup", id="azure", marks=pytest.mark.provider_azure),
+            pytest.param("gemini_chat_provider_setup", id="gemini", marks=pytest.mark.provider_gemini),
+        ],
+    )
+    def test_chat_completions_stream_cancel(self, api_client, request, provider_fixture):
+        """Test canceling a stream early"""
+        setup = request.getfixturevalue(provider_fixture)
+        events, _ = self._open_stream(api_client, setup, stop_after=2)
         assert events
 
+    @pytest.mark.provider_azure
     def test_chat_completions_request_limit(self, api_client, azure_chat_rate_limited_setup):
         """Test request limit returns 429 after limit is reached"""
         payload = {
@@ -333,18 +235,22 @@ class TestChatCompletions:
         first = api_client.create_chat_completion(payload, azure_chat_rate_limited_setup["virtual_key"])
         assert first.status_code == 200
 
+        # Usage is flushed to the limiter about every 50ms, wait just that long first and back off from there
         last_response = None
+        backoff = 0.05
         for _ in range(6):
+            time.sleep(backoff)
             resp = api_client.create_chat_completion(payload, azure_chat_rate_limited_setup["virtual_key"])
             last_response = resp
             if resp.status_code == 429:
                 break
             assert resp.status_code == 200
-            time.sleep(0.3)
+            backoff = min(backoff * 2, 0.3)
 
         assert last_response is not None
         assert last_response.status_code == 429
 
+    @pytest.mark.provider_azure
     def test_chat_completions_invalid_payload(self, api_client, azure_chat_provider_setup):
         """Test invalid payload returns bad request"""
         response = api_client.create_chat_completion({}, azure_chat_provider_setup["virtual_key"])
@@ -362,22 +268,18 @@ class TestChatCompletions:
 
         assert response.status_code == 401
 
-    def test_chat_completions_missing_auth(self):
+    def test_chat_completions_missing_auth(self, api_client):
         """Test missing Authorization header returns unauthorized"""
         payload = {
             "model": "missing",
             "messages": [{"role": "user", "content": "Hello"}],
         }
 
-        response = requests.post(
-            f"{Config.BASE_URL}/v1/chat/completions",
-            headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=Config.TIMEOUT,
-        )
+        response = api_client.create_chat_completion(payload)
 
         assert response.status_code == 401
 
+    @pytest.mark.provider_azure
     def test_chat_completions_azure_invalid_deployment(self, api_client, azure_chat_invalid_provider_setup):
         """Test Azure provider errors propagate (invalid deployment)"""
         payload = {
@@ -389,6 +291,7 @@ class TestChatCompletions:
 
         assert response.status_code == 404
 
+    @pytest.mark.provider_gemini
     def test_chat_completions_gemini_invalid_model(self, api_client, gemini_chat_invalid_provider_setup):
         """Test Gemini provider errors propagate (invalid model)"""
         payload = {
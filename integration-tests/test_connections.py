@@ -1,18 +1,33 @@
 import pytest
 
+pytestmark = pytest.mark.integration
 
-class TestConnections:
-    def test_create_azure_openai_connection_success(self, api_client, sample_azure_openai_connection_data):
-        """Test successful creation of Azure OpenAI connection"""
-        response = api_client.create_connection(sample_azure_openai_connection_data)
 
-        assert response.status_code == 200
-        data = response.json()
+class TestConnections:
+    def test_azure_openai_connection_crud_lifecycle(self, api_client, sample_azure_openai_connection_data):
+        """Test create, get and delete of one Azure OpenAI connection"""
+        create_response = api_client.create_connection(sample_azure_openai_connection_data)
+        assert create_response.status_code == 200
+        data = create_response.json()
         assert 'id' in data
         assert 'provider' in data
+        connection_id = data['id']
 
-        # Cleanup
-        api_client.delete_connection(data['id'])
+        get_response = api_client.get_connection(connection_id)
+        assert get_response.status_code == 200
+        data = get_response.json()
+        assert data['id'] == connection_id
+        assert 'provider' in data
+
+        delete_response = api_client.delete_connection(connection_id)
+        assert delete_response.status_code == 200
+        delete_data = delete_response.json()
+        assert delete_data["success"] is True
+        assert delete_data["message"] is None
+
+        # Verify connection is deleted
+        get_response = api_client.get_connection(connection_id)
+        assert get_response.status_code == 404
 
     def test_create_openai_connection_success(self, api_client, sample_openai_connection_data):
         """Test successful creation of OpenAI connection"""
@@ -40,39 +55,12 @@ class TestConnections:
         # Cleanup
         api_client.delete_connection(data['id'])
 
-    def test_get_azure_openai_connection_success(self, api_client, created_azure_openai_connection):
-        """Test successful connection retrieval"""
-        response = api_client.get_connection(created_azure_openai_connection)
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data['id'] == created_azure_openai_connection
-        assert 'provider' in data
-
     def test_get_connection_not_found(self, api_client, sample_uuid):
         """Test getting non-existent connection returns 404"""
         response = api_client.get_connection(sample_uuid)
 
         assert response.status_code == 404
 
-    def test_delete_connection_success(self, api_client, sample_azure_openai_connection_data):
-        """Test successful connection deletion"""
-        # Create connection first
-        create_response = api_client.create_connection(sample_azure_openai_connection_data)
-        assert create_response.status_code == 200
-        connection_id = create_response.json()['id']
-
-        # Delete connection
-        delete_response = api_client.delete_connection(connection_id)
-        assert delete_response.status_code == 200
-        delete_data = delete_response.json()
-        assert delete_data["success"] is True
-        assert delete_data["message"] is None
-
-        # Verify connection is deleted
-        get_response = api_client.get_connection(connection_id)
-        assert get_response.status_code == 404
-
     def test_delete_connection_not_found(self, api_client, sample_uuid):
         """Test deleting non-existent connection returns 404"""
         response = api_client.delete_connection(sample_uuid)
@@ -102,4 +90,4 @@ class TestConnections:
         assert response.status_code == 200
         data = response.json()
         assert 'connections' in data
-        assert any(item['id'] == created_azure_openai_connection for item in data['connections'])
+        assert created_azure_openai_connection in {item['id'] for item in data['connections']}
@@ -1,6 +1,7 @@
 import pytest
-import requests
-from config import Config
+from conftest import ok_json
+
+pytestmark = pytest.mark.integration
 
 
 class TestEmbeddings:
@@ -13,8 +14,7 @@ class TestEmbeddings:
 
         response = api_client.create_embeddings(payload, openai_embeddings_provider_setup["virtual_key"])
 
-        assert response.status_code == 200
-        data = response.json()
+        data = ok_json(response)
         assert "data" in data
         assert len(data["data"]) > 0
         assert isinstance(data["data"][0]["embedding"], list)
@@ -28,8 +28,7 @@ class TestEmbeddings:
 
         response = api_client.create_embeddings(payload, azure_embeddings_provider_setup["virtual_key"])
 
-        assert response.status_code == 200
-        data = response.json()
+        data = ok_json(response)
         assert "data" in data
         assert len(data["data"]) > 0
 
@@ -42,8 +41,7 @@ class TestEmbeddings:
 
         response = api_client.create_embeddings(payload, azure_embeddings_provider_setup["virtual_key"])
 
-        assert response.status_code == 200
-        data = response.json()
+        data = ok_json(response)
         assert len(data["data"]) == 2
 
     def test_embeddings_gemini(self, api_client, gemini_embeddings_provider_setup):
@@ -55,8 +53,7 @@ class TestEmbeddings:
 
         response = api_client.create_embeddings(payload, gemini_embeddings_provider_setup["virtual_key"])
 
-        assert response.status_code == 200
-        data = response.json()
+        data = ok_json(response)
         assert "data" in data
         assert len(data["data"]) > 0
 
@@ -88,19 +85,14 @@ class TestEmbeddings:
 
         assert response.status_code == 400
 
-    def test_embeddings_missing_auth(self):
+    def test_embeddings_missing_auth(self, api_client):
         """Test missing Authorization header returns unauthorized"""
         payload = {
             "model": "missing",
             "input": "Hello",
         }
 
-        response = requests.post(
-            f"{Config.BASE_URL}/v1/embeddings",
-            headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=Config.TIMEOUT,
-        )
+        response = api_client.create_embeddings(payload)
 
         assert response.status_code == 401
 
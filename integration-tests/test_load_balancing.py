@@ -1,75 +1,68 @@
-import uuid
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
-from conftest import _provider_ready
+from conftest import PROVIDER_READY, _run_concurrently, ok_json, unique_name
 
 
-def _setup_load_balanced_deployment(api_client, project_id, strategy, azure_weight, gemini_weight):
-    if not _provider_ready([
-        Config.AZURE_OPENAI_API_KEY,
-        Config.AZURE_OPENAI_ENDPOINT,
-        Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT,
-        Config.GEMINI_API_KEY,
-        Config.GEMINI_CHAT_COMPLETIONS_MODEL,
-    ]):
-        pytest.skip("Azure/Gemini chat config not fully set")
-
-    deployment_resp = api_client.create_deployment({
-        "name": f"lb-{strategy}-{uuid.uuid4().hex[:8]}",
-        "access": "public",
-        "strategy": strategy,
-    })
-    assert deployment_resp.status_code == 200
-    deployment = deployment_resp.json()
-
-    azure_conn_resp = api_client.create_connection({
-        "provider": "azure/openai",
-        "deployment_name": Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT,
-        "api_endpoint": Config.AZURE_OPENAI_ENDPOINT,
-        "api_key": Config.AZURE_OPENAI_API_KEY,
-        "api_version": Config.AZURE_OPENAI_API_VERSION,
-    })
-    assert azure_conn_resp.status_code == 200
-    azure_conn_id = azure_conn_resp.json()["id"]
-
-    gemini_conn_resp = api_client.create_connection({
-        "provider": "gemini",
-        "model": Config.GEMINI_CHAT_COMPLETIONS_MODEL,
-        "api_endpoint": Config.GEMINI_BASE_URL,
-        "api_key": Config.GEMINI_API_KEY,
-        "api_version": Config.GEMINI_API_VERSION,
-    })
-    assert gemini_conn_resp.status_code == 200
-    gemini_conn_id = gemini_conn_resp.json()["id"]
-
-    azure_map_resp = api_client.create_connection_deployment_map({
-        "connection_id": azure_conn_id,
-        "deployment_id": deployment["id"],
-        "weight": azure_weight,
-    })
-    assert azure_map_resp.status_code == 200
-    azure_map_id = azure_map_resp.json()["id"]
-
-    gemini_map_resp = api_client.create_connection_deployment_map({
-        "connection_id": gemini_conn_id,
-        "deployment_id": deployment["id"],
-        "weight": gemini_weight,
-    })
-    assert gemini_map_resp.status_code == 200
-    gemini_map_id = gemini_map_resp.json()["id"]
+# Decided before setup, so skipped tests never build created_project or any other fixture
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(
+        not (PROVIDER_READY["azure_chat"] and PROVIDER_READY["gemini_chat"]),
+        reason="Azure/Gemini chat config not fully set",
+    ),
+]
 
-    key_resp = api_client.create_virtual_key({
-        "project_id": project_id,
-    })
-    assert key_resp.status_code == 200
-    key_payload = key_resp.json()
 
-    vkd_resp = api_client.create_virtual_key_deployment_map({
-        "virtual_key_id": key_payload["id"],
-        "deployment_id": deployment["id"],
-    })
-    assert vkd_resp.status_code == 200
-    vkd_id = vkd_resp.json()["id"]
+def _setup_load_balanced_deployment(api_client, project_id, strategy, azure_weight, gemini_weight):
+    deployment_resp, azure_conn_resp, gemini_conn_resp, key_resp = _run_concurrently(
+        (api_client.create_deployment, {
+            "name": unique_name(f"lb-{strategy}"),
+            "access": "public",
+            "strategy": strategy,
+        }),
+        (api_client.create_connection, {
+            "provider": "azure/openai",
+            "deployment_name": Config.AZURE_OPENAI_CHAT_COMPLETIONS_DEPLOYMENT,
+            "api_endpoint": Config.AZURE_OPENAI_ENDPOINT,
+            "api_key": Config.AZURE_OPENAI_API_KEY,
+            "api_version": Config.AZURE_OPENAI_API_VERSION,
+        }),
+        (api_client.create_connection, {
+            "provider": "gemini",
+            "model": Config.GEMINI_CHAT_COMPLETIONS_MODEL,
+            "api_endpoint": Config.GEMINI_BASE_URL,
+            "api_key": Config.GEMINI_API_KEY,
+            "api_version": Config.GEMINI_API_VERSION,
+        }),
+        (api_client.create_virtual_key, {
+            "project_id": project_id,
+        }),
+    )
+    deployment = ok_json(deployment_resp)
+    azure_conn_id = ok_json(azure_conn_resp)["id"]
+    gemini_conn_id = ok_json(gemini_conn_resp)["id"]
+    key_payload = ok_json(key_resp)
+
+    azure_map_resp, gemini_map_resp, vkd_resp = _run_concurrently(
+        (api_client.create_connection_deployment_map, {
+            "connection_id": azure_conn_id,
+            "deployment_id": deployment["id"],
+            "weight": azure_weight,
+        }),
+        (api_client.create_connection_deployment_map, {
+            "connection_id": gemini_conn_id,
+            "deployment_id": deployment["id"],
+            "weight": gemini_weight,
+        }),
+        (api_client.create_virtual_key_deployment_map, {
+            "virtual_key_id": key_payload["id"],
+            "deployment_id": deployment["id"],
+        }),
+    )
+    azure_map_id = ok_json(azure_map_resp)["id"]
+    gemini_map_id = ok_json(gemini_map_resp)["id"]
+    vkd_id = ok_json(vkd_resp)["id"]
 
     return {
         "deployment_id": deployment["id"],
@@ -87,25 +80,36 @@ def _setup_load_balanced_deployment(api_client, project_id, strategy, azure_weig
 
 
 def _cleanup_load_balanced_deployment(api_client, setup):
-    api_client.delete_virtual_key_deployment_map(setup["virtual_key_deployment_id"])
-    api_client.delete_virtual_key(setup["virtual_key_id"])
-    api_client.delete_connection_deployment_map(setup["azure_map_id"])
-    api_client.delete_connection_deployment_map(setup["gemini_map_id"])
-    api_client.delete_deployment(setup["deployment_id"])
-    api_client.delete_connection(setup["azure_connection_id"])
-    api_client.delete_connection(setup["gemini_connection_id"])
+    # Maps go first, the entities they point to are then independent of each other
+    _run_concurrently(
+        (api_client.delete_virtual_key_deployment_map, setup["virtual_key_deployment_id"]),
+        (api_client.delete_connection_deployment_map, setup["azure_map_id"]),
+        (api_client.delete_connection_deployment_map, setup["gemini_map_id"]),
+    )
+    _run_concurrently(
+        (api_client.delete_virtual_key, setup["virtual_key_id"]),
+        (api_client.delete_deployment, setup["deployment_id"]),
+        (api_client.delete_connection, setup["azure_connection_id"]),
+        (api_client.delete_connection, setup["gemini_connection_id"]),
+    )
 
 
 def _count_provider_responses(api_client, setup, num_requests):
+    payload = {
+        "model": setup["deployment_name"],
+        "messages": [{"role": "user", "content": "Hello"}],
+    }
+    # Only the totals are checked and the server picks connections under a lock, so the requests can overlap.
+    # A pool as wide as the fan-out keeps every request in flight at once, the shared pool only runs 4
+    with ThreadPoolExecutor(max_workers=num_requests) as pool:
+        responses = _run_concurrently(
+            *[(api_client.create_chat_completion, payload, setup["virtual_key"]) for _ in range(num_requests)],
+            pool=pool,
+        )
+
     counts = {"azure": 0, "gemini": 0}
-    for _ in range(num_requests):
-        payload = {
-            "model": setup["deployment_name"],
-            "messages": [{"role": "user", "content": "Hello"}],
-        }
-        response = api_client.create_chat_completion(payload, setup["virtual_key"])
-        assert response.status_code == 200
-        data = response.json()
+    for response in responses:
+        data = ok_json(response)
         model = data.get("model")
         if model == setup["deployment_name"]:
             counts["azure"] += 1
@@ -1,4 +1,7 @@
 import pytest
+from conftest import ok_json
+
+pytestmark = pytest.mark.integration
 
 
 class TestProjectInviteCodes:
@@ -11,8 +14,7 @@ class TestProjectInviteCodes:
 
         response = api_client.create_project_invite_code(payload)
 
-        assert response.status_code == 200
-        data = response.json()
+        data = ok_json(response)
         assert "id" in data
         assert data["project_id"] == created_project
         assert "code" in data
@@ -23,16 +25,14 @@ class TestProjectInviteCodes:
         invite_id = data["id"]
 
         get_response = api_client.get_project_invite_code(invite_id)
-        assert get_response.status_code == 200
-        get_data = get_response.json()
+        get_data = ok_json(get_response)
         assert get_data["id"] == invite_id
         assert get_data["project_id"] == created_project
         assert get_data["code"] == data["code"]
         assert get_data["role"] == "guest"
 
         delete_response = api_client.delete_project_invite_code(invite_id)
-        assert delete_response.status_code == 200
-        delete_data = delete_response.json()
+        delete_data = ok_json(delete_response)
         assert delete_data["success"] is True
         assert delete_data["message"] is None
 
@@ -1,5 +1,7 @@
 import pytest
 
+pytestmark = pytest.mark.integration
+
 
 class TestSessionTokens:
     def test_create_session_token_success(self, api_client, created_user_with_password):
@@ -13,37 +15,19 @@ class TestSessionTokens:
 
         assert response.status_code == 200
         data = response.json()
-        assert "token" in data
-        assert "info" in data
-        assert data["token"]
-        assert "id" in data["info"]
+        assert data.get("token")
+        assert data.get("info", {}).get("id")
         assert data["info"]["revoked"] is False
         assert data["info"]["user_id"] == created_user_with_password["id"]
 
-    def test_create_session_token_invalid_password(self, api_client, created_user_with_password):
-        """Test creating a session token with invalid password"""
-        payload = {
-            "email": created_user_with_password["email"],
-            "password": "wrong-password",
-        }
-
-        response = api_client.create_session_token(payload)
-
-        assert response.status_code == 401
-
-    def test_create_session_token_unknown_email(self, api_client):
-        """Test creating a session token with unknown email"""
-        payload = {
-            "email": "missing@example.com",
-            "password": "Hello1234",
-        }
-
-        response = api_client.create_session_token(payload)
-
-        assert response.status_code == 401
-
-    def test_create_session_token_invalid_payload(self, api_client):
-        """Test creating a session token with invalid payload"""
-        response = api_client.create_session_token({"email": ""})
-
-        assert response.status_code == 422
+    @pytest.mark.parametrize("payload, expected", [
+        ({"password": "wrong-password"}, 401),
+        ({"email": "missing@example.com", "password": "Hello1234"}, 401),
+        ({"email": ""}, 422),
+    ], ids=["invalid_password", "unknown_email", "invalid_payload"])
+    def test_create_session_token_failures(self, api_client, created_user_with_password, payload, expected):
+        """Test creating a session token with a wrong password, unknown email or invalid payload fails"""
+        # A case without an email logs in as the real user, so only its password is wrong
+        response = api_client.create_session_token({"email": created_user_with_password["email"], **payload})
+
+        assert response.status_code == expected
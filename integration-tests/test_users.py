@@ -1,25 +1,28 @@
 import pytest
+from conftest import _run_concurrently
+
+pytestmark = pytest.mark.integration
 
 
 class TestUsers:
-    def test_create_user_success(self, api_client, sample_user_data):
+    def test_create_user_success(self, api_client, sample_user_data, cleanup_registry):
         """Test successful user creation"""
-        response = api_client.create_user(sample_user_data)
+        user_data = sample_user_data()
+
+        response = api_client.create_user(user_data)
 
         assert response.status_code == 200
         data = response.json()
         assert 'id' in data
-        assert data['name'] == sample_user_data['name']
-        assert data['email'] == sample_user_data['email']
-        assert data['role'] == sample_user_data['role']
+        cleanup_registry.add("user", data['id'])
+        assert data['name'] == user_data['name']
+        assert data['email'] == user_data['email']
+        assert data['role'] == user_data['role']
         assert data['blocked'] is False
 
-        # Cleanup
-        api_client.delete_user(data['id'])
-
-    def test_create_user_duplicate_email(self, api_client, sample_user_data, created_user):
+    def test_create_user_duplicate_email(self, api_client, created_user_data, created_user):
         """Test creating user with duplicate email fails"""
-        response = api_client.create_user(sample_user_data)
+        response = api_client.create_user(created_user_data)
 
         assert response.status_code == 409
         assert 'error' in response.json()
@@ -34,48 +37,60 @@ class TestUsers:
         assert 'name' in data
         assert 'email' in data
 
-    def test_get_user_self_via_session(self, api_client, created_user_with_password):
-        """Test user retrieval via session token"""
-        token_response = api_client.create_session_token({
-            "email": created_user_with_password["email"],
-            "password": created_user_with_password["password"],
-        })
-        assert token_response.status_code == 200
-        token = token_response.json()["token"]
+    @pytest.mark.parametrize("client_fixture", ["api_client", "cached_api_client"], ids=["uncached", "cached"])
+    def test_get_user_self_via_session(self, request, client_fixture, authed_session):
+        """Test user retrieval via session token, after an admin GET of the same URL"""
+        client = request.getfixturevalue(client_fixture)
+        # Both runs can share one cache under --use-requests-cache, start each from an empty one
+        client.clear_cache()
+        # Primes a cached client with the admin response the session GET must not be served
+        assert client.get_user(authed_session.user_id).status_code == 200
 
-        response = api_client.get_user_with_session(created_user_with_password["id"], token)
+        response = client.get_user_with_session(authed_session.user_id, authed_session.token)
 
         assert response.status_code == 200
+        assert not getattr(response, "from_cache", False)
         data = response.json()
-        assert data["id"] == created_user_with_password["id"]
-        assert data["email"] == created_user_with_password["email"]
+        assert data["id"] == authed_session.user_id
+        assert data["email"] == authed_session.user["email"]
 
-    def test_get_current_user_success(self, api_client, created_user_with_password):
+    @pytest.mark.parametrize("client_fixture", ["api_client", "cached_api_client"], ids=["uncached", "cached"])
+    def test_get_current_user_success(self, request, client_fixture, authed_session):
         """Test current user retrieval via session token"""
-        token_response = api_client.create_session_token({
-            "email": created_user_with_password["email"],
-            "password": created_user_with_password["password"],
-        })
-        assert token_response.status_code == 200
-        token = token_response.json()["token"]
-
-        response = api_client.get_current_user(token)
+        response = request.getfixturevalue(client_fixture).get_current_user(authed_session.token)
 
         assert response.status_code == 200
         data = response.json()
-        assert data["id"] == created_user_with_password["id"]
-        assert data["email"] == created_user_with_password["email"]
+        assert data["id"] == authed_session.user_id
+        assert data["email"] == authed_session.user["email"]
+
+    def test_get_user_invalid_session_after_cached_admin_get(self, cached_api_client, created_user):
+        """Test a session GET with a bad token is not answered from the admin GET cached for the same URL"""
+        # Independent of what earlier tests left in the shared cache
+        cached_api_client.clear_cache()
+        assert cached_api_client.get_user(created_user).status_code == 200
+        assert cached_api_client.get_user(created_user).from_cache
+
+        response = cached_api_client.get_user_with_session(created_user, "invalid-session-token")
 
-    def test_get_user_not_found(self, api_client, sample_uuid):
-        """Test getting non-existent user returns 404"""
-        response = api_client.get_user(sample_uuid)
+        assert response.status_code == 401
+        assert not response.from_cache
 
-        assert response.status_code == 404
+    def test_user_not_found(self, api_client, sample_uuid):
+        """Test getting and deleting a non-existent user both return 404, probed concurrently"""
+        get_response, delete_response = _run_concurrently(
+            (api_client.get_user, sample_uuid),
+            (api_client.delete_user, sample_uuid),
+        )
 
-    def test_delete_user_success(self, api_client, sample_user_data):
+        assert get_response.status_code == 404
+        assert delete_response.status_code == 404
+
+    def test_delete_user_success(self, api_client, sample_user_data, thorough):
         """Test successful user deletion"""
         # Create user first
-        create_response = api_client.create_user(sample_user_data)
+        user_data = sample_user_data()
+        create_response = api_client.create_user(user_data)
         assert create_response.status_code == 200
         user_id = create_response.json()['id']
 
@@ -86,15 +101,10 @@ class TestUsers:
         assert delete_data["success"] is True
         assert str(user_id) in delete_data["message"]
 
-        # Verify user is deleted
-        get_response = api_client.get_user(user_id)
-        assert get_response.status_code == 404
-
-    def test_delete_user_not_found(self, api_client):
-        """Test deleting non-existent user returns 404"""
-        response = api_client.delete_user("07849650-088f-43ba-9062-757b85c000e1")
-
-        assert response.status_code == 404
+        # Verify user is deleted, only with --thorough
+        if thorough:
+            get_response = api_client.get_user(user_id)
+            assert get_response.status_code == 404
 
     def test_create_user_invalid_data(self, api_client):
         """Test creating user with invalid data fails"""
@@ -1,24 +1,22 @@
 import pytest
+from conftest import _run_concurrently
+
+pytestmark = pytest.mark.integration
 
 
 class TestVirtualKeyDeploymentMaps:
-    def test_create_virtual_key_deployment_map_success(self, api_client, created_virtual_key, created_deployment):
+    def test_create_virtual_key_deployment_map_success(self, api_client, fresh_virtual_key_deployment_map_data, cleanup_registry):
         """Test successful creation of association between key and a deployment"""
-        payload = {
-            'virtual_key_id': created_virtual_key,
-            'deployment_id': created_deployment
-        }
+        payload = fresh_virtual_key_deployment_map_data
 
         response = api_client.create_virtual_key_deployment_map(payload)
 
         assert response.status_code == 200
         data = response.json()
         assert 'id' in data
-        assert data['virtual_key_id'] == created_virtual_key
-        assert data['deployment_id'] == created_deployment
-
-        # Cleanup
-        api_client.delete_virtual_key_deployment_map(data['id'])
+        cleanup_registry.add("virtual_key_deployment_map", data['id'])
+        assert data['virtual_key_id'] == payload['virtual_key_id']
+        assert data['deployment_id'] == payload['deployment_id']
 
     def test_get_virtual_key_deployment_map_success(self, api_client, created_virtual_key_deployment_map):
         """Test successful retrieval of association between virtual key and a deployment"""
@@ -30,22 +28,15 @@ class TestVirtualKeyDeploymentMaps:
         assert 'virtual_key_id' in data
         assert 'deployment_id' in data
 
-    def test_create_virtual_key_deployment_map_duplicate(self, api_client, created_virtual_key, created_deployment):
+    def test_create_virtual_key_deployment_map_duplicate(
+        self, api_client, created_virtual_key_deployment_map, sample_virtual_key_deployment_map_data
+    ):
         """Test duplicate virtual key/deployment map returns conflict"""
-        payload = {
-            'virtual_key_id': created_virtual_key,
-            'deployment_id': created_deployment
-        }
-
-        first = api_client.create_virtual_key_deployment_map(payload)
-        assert first.status_code == 200
-        first_id = first.json()['id']
+        # The fixture already mapped this pair, only the conflicting create is left to send
+        response = api_client.create_virtual_key_deployment_map(sample_virtual_key_deployment_map_data)
 
-        second = api_client.create_virtual_key_deployment_map(payload)
-        assert second.status_code == 409
-        assert 'error' in second.json()
-
-        api_client.delete_virtual_key_deployment_map(first_id)
+        assert response.status_code == 409
+        assert 'error' in response.json()
 
     def test_create_virtual_key_deployment_map_invalid_refs(self, api_client, sample_uuid, created_deployment):
         """Test invalid virtual key id returns not found"""
@@ -67,43 +58,34 @@ class TestVirtualKeyDeploymentMaps:
         response = api_client.create_virtual_key_deployment_map(payload)
         assert response.status_code == 404
 
-    def test_search_virtual_key_deployment_maps_by_key(self, api_client, created_virtual_key, created_deployment):
+    def test_search_virtual_key_deployment_maps_by_key(self, api_client, fresh_virtual_key_deployment_map_data, cleanup_registry):
         """Test searching virtual key deployment maps by key returns expected entries"""
-        payload = {
-            'virtual_key_id': created_virtual_key,
-            'deployment_id': created_deployment
-        }
+        payload = fresh_virtual_key_deployment_map_data
 
         create_response = api_client.create_virtual_key_deployment_map(payload)
         assert create_response.status_code == 200
         map_id = create_response.json()['id']
+        cleanup_registry.add("virtual_key_deployment_map", map_id)
 
-        response = api_client.search_virtual_key_deployment_maps(virtual_key_id=created_virtual_key)
+        response = api_client.search_virtual_key_deployment_maps(virtual_key_id=payload['virtual_key_id'])
         assert response.status_code == 200
         data = response.json()
         assert 'maps' in data
-        assert any(item['id'] == map_id for item in data['maps'])
+        assert map_id in {item['id'] for item in data['maps']}
 
-        api_client.delete_virtual_key_deployment_map(map_id)
+    def test_virtual_key_deployment_map_not_found(self, api_client, sample_uuid):
+        """Test getting and deleting a non-existent virtual key deployment map both return 404, probed concurrently"""
+        get_response, delete_response = _run_concurrently(
+            (api_client.get_virtual_key_deployment_map, sample_uuid),
+            (api_client.delete_virtual_key_deployment_map, sample_uuid),
+        )
 
-    def test_get_virtual_key_deployment_map_not_found(self, api_client, sample_uuid):
-        """Test fetching missing virtual key deployment map returns not found"""
-        response = api_client.get_virtual_key_deployment_map(sample_uuid)
-
-        assert response.status_code == 404
-
-    def test_delete_virtual_key_deployment_map_not_found(self, api_client, sample_uuid):
-        """Test deleting missing virtual key deployment map returns not found"""
-        response = api_client.delete_virtual_key_deployment_map(sample_uuid)
-
-        assert response.status_code == 404
+        assert get_response.status_code == 404
+        assert delete_response.status_code == 404
 
-    def test_delete_virtual_key_deployment_map_success(self, api_client, created_virtual_key, created_deployment):
+    def test_delete_virtual_key_deployment_map_success(self, api_client, fresh_virtual_key_deployment_map_data, thorough):
         """Test deleting virtual key deployment map returns success"""
-        payload = {
-            'virtual_key_id': created_virtual_key,
-            'deployment_id': created_deployment
-        }
+        payload = fresh_virtual_key_deployment_map_data
 
         create_response = api_client.create_virtual_key_deployment_map(payload)
         assert create_response.status_code == 200
@@ -115,5 +97,7 @@ class TestVirtualKeyDeploymentMaps:
         assert delete_data["success"] is True
         assert delete_data["message"] is None
 
-        get_response = api_client.get_virtual_key_deployment_map(map_id)
-        assert get_response.status_code == 404
+        # Verify the map is deleted, only with --thorough
+        if thorough:
+            get_response = api_client.get_virtual_key_deployment_map(map_id)
+            assert get_response.status_code == 404